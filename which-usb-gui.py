@@ -1,18 +1,182 @@
 #!/usr/bin/env python3
+import glob
+import io
 import os
+import re
 import subprocess
 import sys
+import threading
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QTextEdit, QLabel, QGroupBox,
                              QMessageBox, QProgressBar, QFrame, QScrollArea, QStackedWidget)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QUrl
-from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QClipboard, QPixmap
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from typing import Dict, List, Tuple
+from PyQt6.QtCore import QThread, QThreadPool, QRunnable, QObject, pyqtSignal, Qt, QTimer, QUrl
+from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QClipboard, QPixmap, QImage
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkDiskCache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import time
-import tempfile
-import urllib.request
+
+try:
+    import pyudev
+except ImportError:  # Fall back to polling sysfs
+    pyudev = None
+
+SYSFS_USB_DEVICES = '/sys/bus/usb/devices'
+SYSFS_DEV_CHAR = '/sys/dev/char'
+UDEV_DATA_DIR = '/run/udev/data'
+# Present only while udevd runs; without it a udev monitor never receives events
+UDEV_CONTROL_SOCKET = '/run/udev/control'
+# Rescan this often even with a udev monitor, in case its events never arrive
+MONITOR_RESCAN_INTERVAL = 3.0
+# usb.ids locations used by common distros, for when there is no udev database
+USB_IDS_PATHS = ('/usr/share/hwdata/usb.ids', '/usr/share/misc/usb.ids',
+                 '/usr/share/usb.ids', '/var/lib/usbutils/usb.ids')
+# Device attributes included in the detailed inspection
+SYSFS_DETAIL_ATTRS = ('idVendor', 'idProduct', 'manufacturer', 'product', 'serial', 'bcdDevice', 'speed')
+
+# Shared fonts, built once instead of per widget
+FONT_H1 = QFont("Arial", 24, QFont.Weight.Bold)
+FONT_H2 = QFont("Arial", 18, QFont.Weight.Bold)
+FONT_H3 = QFont("Arial", 16, QFont.Weight.Bold)
+FONT_BODY_LARGE = QFont("Arial", 16)
+FONT_BODY = QFont("Arial", 14)
+FONT_VALUE = QFont("Arial", 20, QFont.Weight.Bold)
+FONT_BUTTON = QFont("Arial", 14, QFont.Weight.Bold)
+FONT_BUTTON_SMALL = QFont("Arial", 12, QFont.Weight.Bold)
+FONT_SMALL = QFont("Arial", 12)
+FONT_FOOTER = QFont("Arial", 10)
+FONT_COUNTDOWN = QFont("Arial", 48, QFont.Weight.Bold)
+FONT_ICON = QFont("Arial", 36)
+FONT_MONO = QFont("Courier", 9)
+
+# Application-wide stylesheet, parsed once; widgets opt in via their object name
+APP_STYLESHEET = """
+    QProgressBar#loadingProgress {
+        border: 2px solid #1976D2;
+        border-radius: 8px;
+        text-align: center;
+        font-weight: bold;
+        color: white;
+        background-color: #f0f0f0;
+        height: 30px;
+    }
+    QProgressBar#loadingProgress::chunk {
+        background-color: #1976D2;
+        border-radius: 6px;
+    }
+    QPushButton#yesBtn, QPushButton#noBtn, QPushButton#viewResultsBtn,
+    QPushButton#backBtn, QPushButton#restartBtn {
+        color: white;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton#yesBtn {
+        background-color: #4CAF50;
+        padding: 15px 30px;
+        min-width: 200px;
+    }
+    QPushButton#yesBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#noBtn {
+        background-color: #2196F3;
+        padding: 15px 30px;
+        min-width: 200px;
+    }
+    QPushButton#noBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#viewResultsBtn {
+        background-color: #FF9800;
+        padding: 15px 40px;
+        min-width: 200px;
+    }
+    QPushButton#viewResultsBtn:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#backBtn {
+        background-color: #757575;
+        border-radius: 6px;
+        padding: 8px 16px;
+    }
+    QPushButton#backBtn:hover {
+        background-color: #616161;
+    }
+    QPushButton#restartBtn {
+        background-color: #4CAF50;
+        padding: 12px 30px;
+    }
+    QPushButton#restartBtn:hover {
+        background-color: #45a049;
+    }
+    QFrame#successFrame, QFrame#successFrame QLabel {
+        background-color: #E8F5E8;
+        border: 2px solid #4CAF50;
+        border-radius: 12px;
+        padding: 20px;
+        margin: 20px;
+    }
+"""
+
+# Result cards shown for an identified device: (field, title, accent color)
+DEVICE_CARDS = (
+    ('name', "Name", "#4CAF50"),
+    ('bus', "USB Bus", "#2196F3"),
+    ('vendor', "Vendor ID", "#FF9800"),
+    ('product', "Product ID", "#9C27B0"),
+    ('plain', "Plain Text Line", "#795548"),
+)
+
+# Hover color for each card accent color
+CARD_HOVER_COLORS = {
+    "#4CAF50": "#45a049",
+    "#2196F3": "#1976D2",
+    "#FF9800": "#F57C00",
+    "#9C27B0": "#7B1FA2",
+    "#795548": "#5D4037",
+}
+
+# (frame, title, copy button) stylesheets for each card color, formatted once at import
+CARD_STYLESHEETS = {
+    color: (
+        f"""
+            QFrame {{
+                background-color: white;
+                border: 3px solid {color};
+                border-radius: 12px;
+                padding: 20px;
+                margin: 10px;
+            }}
+        """,
+        f"color: {color}; margin-bottom: 10px;",
+        f"""
+            QPushButton {{
+                background-color: {color};
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 10px 20px;
+            }}
+            QPushButton:hover {{
+                background-color: {hover_color};
+            }}
+        """,
+    )
+    for color, hover_color in CARD_HOVER_COLORS.items()
+}
+
+# Display size (square bounding box, in px) of each image; images are scaled once on load
+IMAGE_SIZES = {
+    'header': 600,
+    'found': 200,
+    'loading': 300,
+    'attach': 400,
+    'disconnect': 400,
+}
+
+# Downloaded images are kept here so later launches skip the network
+IMAGE_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'which-usb')
 
 @dataclass
 class USBDevice:
@@ -22,150 +186,368 @@ class USBDevice:
     product_id: str
     description: str
 
-class ImageLoader(QThread):
-    image_loaded = pyqtSignal(str, QPixmap)  # url, pixmap
-    
-    def __init__(self, url):
-        super().__init__()
-        self.url = url
-        self.finished.connect(self.deleteLater)  # Clean up thread when finished
+DeviceKey = Tuple[str, str, str, str]  # vendor_id, product_id, bus, device
+
+def device_key(device: USBDevice) -> DeviceKey:
+    """Key that uniquely identifies a device within a capture."""
+    return (device.vendor_id, device.product_id, device.bus, device.device)
+
+def index_devices(devices: List[USBDevice]) -> Dict[DeviceKey, USBDevice]:
+    """Index a capture by device key."""
+    return {device_key(d): d for d in devices}
+
+def read_sysfs_attr(device_path: str, name: str) -> str:
+    """Read a single sysfs attribute, returning '' if it is missing or unreadable."""
+    try:
+        with open(os.path.join(device_path, name)) as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+def sysfs_device_matches(path: str, bus: str, device: str) -> bool:
+    """Check whether a sysfs device directory has the given bus and device numbers."""
+    busnum = read_sysfs_attr(path, 'busnum')
+    devnum = read_sysfs_attr(path, 'devnum')
+    return bool(busnum and devnum) and int(busnum) == int(bus) and int(devnum) == int(device)
+
+def find_sysfs_device(bus: str, device: str) -> Optional[str]:
+    """Find the sysfs directory of the device with the given bus and device numbers."""
+    # USB device nodes are char major 189, minor (bus - 1) * 128 + (device - 1),
+    # and /sys/dev/char links each node straight to its device directory
+    char_link = os.path.join(SYSFS_DEV_CHAR, f"189:{(int(bus) - 1) * 128 + int(device) - 1}")
+    if os.path.exists(char_link):
+        path = os.path.realpath(char_link)
+        if sysfs_device_matches(path, bus, device):
+            return path
     
-    def run(self):
+    # Fall back to scanning every USB device
+    if not os.path.isdir(SYSFS_USB_DEVICES):
+        return None
+    for entry in os.scandir(SYSFS_USB_DEVICES):
+        if ':' in entry.name:
+            continue  # Interface, not a device
+        if sysfs_device_matches(entry.path, bus, device):
+            return entry.path
+    return None
+
+def read_udev_properties(device_path: str) -> Dict[str, str]:
+    """Read a device's properties from the udev database, as pyudev would."""
+    dev = read_sysfs_attr(device_path, 'dev')  # "major:minor"
+    if not dev:
+        return {}
+    properties = {}
+    try:
+        with open(os.path.join(UDEV_DATA_DIR, f"c{dev}"), errors='replace') as f:
+            for line in f:
+                if line.startswith('E:'):
+                    key, _, value = line[2:].rstrip('\n').partition('=')
+                    properties[key] = value
+    except OSError:
+        return {}
+    return properties
+
+@lru_cache(maxsize=None)
+def load_usb_ids() -> Tuple[Dict[str, str], Dict[Tuple[str, str], str]]:
+    """Parse the first usb.ids found into vendor and (vendor, product) name tables."""
+    vendors, products = {}, {}
+    for ids_path in USB_IDS_PATHS:
         try:
-            # Download image to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                urllib.request.urlretrieve(self.url, temp_file.name)
-                pixmap = QPixmap(temp_file.name)
-                if not pixmap.isNull():
-                    self.image_loaded.emit(self.url, pixmap)
-                os.unlink(temp_file.name)
-        except Exception as e:
-            print(f"Failed to load image from {self.url}: {e}")
+            with open(ids_path, errors='replace') as f:
+                vendor_id = None
+                for line in f:
+                    if line.startswith('#') or not line.strip():
+                        continue
+                    if line.startswith('\t\t'):
+                        continue  # Interface entry
+                    if line.startswith('\t'):
+                        if vendor_id:
+                            product_id, _, name = line.strip().partition(' ')
+                            products[(vendor_id, product_id.lower())] = name.strip()
+                        continue
+                    ident, _, name = line.rstrip('\n').partition(' ')
+                    if len(ident) != 4:
+                        break  # Vendor list is over; device classes etc. follow
+                    vendor_id = ident.lower()
+                    vendors[vendor_id] = name.strip()
+        except OSError:
+            continue
+        break
+    return vendors, products
+
+def database_names(device_path: str, vendor_id: str, product_id: str) -> Tuple[str, str]:
+    """Look up the hwdb/usb.ids vendor and model names lsusb shows for a device."""
+    properties = read_udev_properties(device_path)
+    if properties:
+        return properties.get('ID_VENDOR_FROM_DATABASE', ''), properties.get('ID_MODEL_FROM_DATABASE', '')
+    # No udev database (e.g. containers); go to usb.ids, which hwdb is built from
+    vendors, products = load_usb_ids()
+    return vendors.get(vendor_id, ''), products.get((vendor_id, product_id), '')
 
-class LoadingThread(QThread):
-    progress_update = pyqtSignal(int)
-    loading_finished = pyqtSignal()
+def sysfs_device_report(bus: str, device: str) -> str:
+    """Format a device's uevent, detail attributes and udev properties as KEY=VALUE lines."""
+    buf = io.StringIO()
+    w = buf.write
+    try:
+        path = find_sysfs_device(bus, device)
+        if path:
+            w(f"Device path: {path}\n")
+            with open(os.path.join(path, 'uevent')) as f:
+                w(f.read().rstrip('\n'))
+                w("\n")
+            for attr in SYSFS_DETAIL_ATTRS:
+                value = read_sysfs_attr(path, attr)
+                if value:
+                    w(f"{attr}={value}\n")
+            for key, value in read_udev_properties(path).items():
+                w(f"{key}={value}\n")
+        else:
+            w("Could not find device in sysfs\n")
+    except Exception as e:
+        w(f"Error reading sysfs: {e}\n")
+    return buf.getvalue()
+
+# Start of each device's section in `lsusb -v` output
+LSUSB_SECTION_RE = re.compile(r'^Bus (\d+) Device (\d+): ID ([0-9a-f]{4}):([0-9a-f]{4})', re.MULTILINE)
+
+def lsusb_verbose_command(device: Optional[USBDevice] = None) -> List[str]:
+    """Build the `lsusb -v` command line, for one device or all of them."""
+    command = ['lsusb', '-v']
+    if device is not None:
+        command += ['-s', f"{int(device.bus)}:{int(device.device)}"]
+    return command
+
+def split_lsusb_verbose(stdout: bytes) -> Dict[DeviceKey, str]:
+    """Split `lsusb -v` output into per-device sections."""
+    # Decode once ourselves; descriptor strings aren't guaranteed to be valid UTF-8
+    output = stdout.decode('utf-8', errors='replace')
+    matches = list(LSUSB_SECTION_RE.finditer(output))
+    sections = {}
+    for i, match in enumerate(matches):
+        bus, device, vendor_id, product_id = match.groups()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(output)
+        sections[(vendor_id, product_id, bus, device)] = output[match.start():end].rstrip()
+    return sections
+
+def enumerate_usb() -> List[USBDevice]:
+    """List connected USB devices by reading sysfs directly (no lsusb fork/exec)."""
+    devices = []
+    for path in glob.glob(os.path.join(SYSFS_USB_DEVICES, '*')):
+        if ':' in os.path.basename(path):
+            continue  # Interface, not a device
+        vendor_id = read_sysfs_attr(path, 'idVendor')
+        product_id = read_sysfs_attr(path, 'idProduct')
+        busnum = read_sysfs_attr(path, 'busnum')
+        devnum = read_sysfs_attr(path, 'devnum')
+        if not (vendor_id and product_id and busnum and devnum):
+            continue
+        # Zero-pad to match lsusb's "Bus 001 Device 002" formatting
+        bus = f"{int(busnum):03d}"
+        device = f"{int(devnum):03d}"
+        # Like lsusb, prefer database names and fall back to the device's string descriptors
+        vendor_name, model_name = database_names(path, vendor_id, product_id)
+        name_parts = [vendor_name or read_sysfs_attr(path, 'manufacturer'),
+                      model_name or read_sysfs_attr(path, 'product')]
+        description = ' '.join(part for part in name_parts if part) or 'Unknown device'
+        devices.append(USBDevice(bus, device, vendor_id, product_id, description))
+    devices.sort(key=lambda d: (d.bus, d.device))
+    return devices
+
+class ImageDecodeSignals(QObject):
+    image_decoded = pyqtSignal(str, QImage)  # name, image
+
+class ImageDecodeRunnable(QRunnable):
+    """Decode and scale image bytes to a QImage off the GUI thread (QPixmap is GUI-thread only)"""
     
-    def __init__(self, duration_ms=3000):
+    def __init__(self, name, data, size):
         super().__init__()
-        self.duration_ms = duration_ms
-        self.finished.connect(self.deleteLater)
+        self.name = name
+        self.data = data
+        self.size = size
+        self.signals = ImageDecodeSignals()
     
     def run(self):
-        steps = 100
-        step_duration = self.duration_ms / steps / 1000.0  # Convert to seconds
-        
-        for i in range(steps + 1):
-            self.progress_update.emit(i)
-            if i < steps:
-                time.sleep(step_duration)
-        
-        self.loading_finished.emit()
+        image = QImage.fromData(self.data)
+        if not image.isNull():
+            image = image.scaled(self.size, self.size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Emit even on failure so the receiver can count the image as done
+        self.signals.image_decoded.emit(self.name, image)
 
-class CountdownThread(QThread):
-    countdown_update = pyqtSignal(int)
-    countdown_finished = pyqtSignal()
+class CaptureSignals(QObject):
+    finished = pyqtSignal(list)
+
+class CaptureRunnable(QRunnable):
+    """Capture the current USB devices on a pool thread"""
     
-    def __init__(self, seconds=3):
+    def __init__(self):
         super().__init__()
-        self.seconds = seconds
+        self.signals = CaptureSignals()
     
     def run(self):
-        for i in range(self.seconds, 0, -1):
-            self.countdown_update.emit(i)
-            time.sleep(1)
-        self.countdown_finished.emit()
+        self.signals.finished.emit(enumerate_usb())
 
-class USBCaptureThread(QThread):
-    finished = pyqtSignal(list)
+class DetailCaptureSignals(QObject):
+    # Workflow generation, device key -> lsusb -v section, device key -> sysfs/udev report
+    captured = pyqtSignal(int, dict, dict)
+
+class DetailCaptureRunnable(QRunnable):
+    """Capture sysfs/udev reports and `lsusb -v` while devices are still attached"""
     
-    def run(self):
-        devices = self.run_lsusb()
-        self.finished.emit(devices)
+    def __init__(self, generation, device=None):
+        super().__init__()
+        self.generation = generation  # Workflow that asked for this capture
+        self.device = device  # Only describe this device; None for all of them
+        self.signals = DetailCaptureSignals()
+        self.lock = threading.Lock()  # Guards process/cancelled against cancel()
+        self.process = None
+        self.cancelled = False
+        self.done = False
     
-    def run_lsusb(self) -> List[USBDevice]:
-        """Run lsusb and parse the output into USBDevice objects."""
+    def run(self):
+        # sysfs first: it's quick, and a device about to be unplugged is still there
+        devices = [self.device] if self.device is not None else enumerate_usb()
+        reports = {device_key(d): sysfs_device_report(d.bus, d.device) for d in devices}
+        
+        sections = {}
         try:
-            result = subprocess.run(['lsusb'], capture_output=True, text=True, check=True)
-            devices = []
-            for line in result.stdout.splitlines():
-                parts = line.split()
-                if len(parts) >= 6:
-                    bus = parts[1].strip(':')
-                    device = parts[3].strip(':')
-                    vendor_product = parts[5].split(':')
-                    if len(vendor_product) == 2:
-                        vendor_id, product_id = vendor_product
-                        description = ' '.join(parts[6:]) if len(parts) > 6 else 'Unknown device'
-                        devices.append(USBDevice(bus, device, vendor_id, product_id, description))
-            return devices
-        except subprocess.CalledProcessError:
-            return []
+            with self.lock:
+                if self.cancelled:
+                    return
+                # The GUI holds no fds that need closing in the child (Qt sets FD_CLOEXEC),
+                # so skip close_fds' sweep of the descriptor table
+                self.process = subprocess.Popen(lsusb_verbose_command(self.device), stdout=subprocess.PIPE,
+                                                stderr=subprocess.DEVNULL, close_fds=False)
+            stdout, _ = self.process.communicate(timeout=15)
+            if not self.cancelled:
+                sections = split_lsusb_verbose(stdout)
+        except OSError:
+            pass
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.communicate()
+        finally:
+            self.done = True
+        self.signals.captured.emit(self.generation, sections, reports)
+    
+    def cancel(self):
+        """Kill the running lsusb so the pool thread is freed right away"""
+        with self.lock:
+            self.cancelled = True
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
 
 class USBMonitorThread(QThread):
-    device_change_detected = pyqtSignal(list)
+    device_change_detected = pyqtSignal(dict, list)  # current capture, added/removed devices
     
-    def __init__(self, baseline_devices, monitor_type='disconnect'):
+    def __init__(self, baseline_index, monitor_type='disconnect'):
         super().__init__()
-        self.baseline_devices = baseline_devices
+        self.baseline_index = baseline_index
         self.monitor_type = monitor_type  # 'disconnect' or 'connect'
         self.running = True
         
     def run(self):
-        """Continuously monitor for USB device changes"""
+        """Monitor for USB device changes"""
+        if pyudev is None or not os.path.exists(UDEV_CONTROL_SOCKET):
+            self.poll_for_change()
+            return
+        
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            monitor.filter_by('usb', device_type='usb_device')
+            monitor.start()
+        except (ImportError, OSError):
+            # libudev missing or netlink blocked (e.g. Flatpak, snap, containers)
+            self.poll_for_change()
+            return
+        
+        # Catch changes that happened before we subscribed
+        if self.check_for_change():
+            return
+        
+        # Block on udev events; the timeout keeps stop() responsive, and the periodic
+        # rescan keeps a monitor that never gets events from hanging the workflow
+        last_scan = time.monotonic()
         while self.running:
-            current_devices = self.run_lsusb()
-            
-            if self.monitor_type == 'disconnect':
-                # Check if any device was removed
-                if len(current_devices) < len(self.baseline_devices):
-                    # Device was disconnected
-                    self.device_change_detected.emit(current_devices)
-                    break
-            else:  # connect
-                # Check if any device was added
-                if len(current_devices) > len(self.baseline_devices):
-                    # Device was connected
-                    self.device_change_detected.emit(current_devices)
+            device = monitor.poll(timeout=0.5)
+            if device is not None and device.action in ('add', 'remove'):
+                rescan = True
+            else:
+                rescan = time.monotonic() - last_scan >= MONITOR_RESCAN_INTERVAL
+            if rescan:
+                last_scan = time.monotonic()
+                if self.check_for_change():
                     break
-            
+    
+    def poll_for_change(self):
+        """Poll sysfs until a change is detected (used when udev monitoring is unavailable)"""
+        while self.running:
+            if self.check_for_change():
+                break
             time.sleep(0.5)  # Check every 500ms for responsive detection
     
+    def check_for_change(self) -> bool:
+        """Capture devices and emit if the expected change has happened"""
+        current_index = index_devices(enumerate_usb())
+        
+        if self.monitor_type == 'disconnect':
+            # Check if any device was removed
+            removed = self.baseline_index.keys() - current_index.keys()
+            changed_devices = [self.baseline_index[k] for k in removed]
+        else:  # connect
+            # Check if any device was added
+            added = current_index.keys() - self.baseline_index.keys()
+            changed_devices = [current_index[k] for k in added]
+        
+        if changed_devices:
+            changed_devices.sort(key=lambda d: (d.bus, d.device))  # lsusb order
+            self.device_change_detected.emit(current_index, changed_devices)
+        return bool(changed_devices)
+    
     def stop(self):
         """Stop monitoring"""
         self.running = False
-    
-    def run_lsusb(self) -> List[USBDevice]:
-        """Run lsusb and parse the output into USBDevice objects."""
-        try:
-            result = subprocess.run(['lsusb'], capture_output=True, text=True, check=True)
-            devices = []
-            for line in result.stdout.splitlines():
-                parts = line.split()
-                if len(parts) >= 6:
-                    bus = parts[1].strip(':')
-                    device = parts[3].strip(':')
-                    vendor_product = parts[5].split(':')
-                    if len(vendor_product) == 2:
-                        vendor_id, product_id = vendor_product
-                        description = ' '.join(parts[6:]) if len(parts) > 6 else 'Unknown device'
-                        devices.append(USBDevice(bus, device, vendor_id, product_id, description))
-            return devices
-        except subprocess.CalledProcessError:
-            return []
 
 class WhichUSBGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Which USB? - Device Identifier")
         self.setGeometry(100, 100, 800, 600)
+        self.clipboard = QApplication.clipboard()
         
         # Data storage
-        self.first_capture = []
-        self.second_capture = []
+        self.first_capture: Dict[DeviceKey, USBDevice] = {}
+        self.second_capture: Dict[DeviceKey, USBDevice] = {}
         self.identified_device = None
         self.detailed_inspection_data = None
         self.monitor_thread = None
+        self.lsusb_cache: Dict[DeviceKey, str] = {}  # lsusb -v sections captured so far
+        self.sysfs_cache: Dict[DeviceKey, str] = {}  # sysfs/udev reports captured so far
+        # Detail captures run lsusb -v, which can take seconds, so they get their own pool:
+        # captures, image decodes and inspections on the global pool never queue behind
+        # it. Two threads let a fresh run start while one from an abandoned workflow is
+        # still finishing.
+        self.detail_pool = QThreadPool(self)
+        self.detail_pool.setMaxThreadCount(2)
+        self.detail_captures: List[DetailCaptureRunnable] = []  # Started and not yet finished
+        self.details_pending = False  # A detail capture is still running
+        self.workflow_generation = 0  # Bumped on reset so late detail captures are ignored
+        self.inspection_deferred = False  # Inspection is waiting for that capture
+        self.last_countdown_shown = None
+        
+        # One countdown timer for the window's lifetime, ticking on the GUI thread
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.timeout.connect(self.countdown_tick)
+        self.countdown_remaining = 0
+        self.countdown_on_finished = None
+        
+        # Pause before the disconnect countdown; a member so reset can cancel it
+        self.pre_disconnect_timer = QTimer(self)
+        self.pre_disconnect_timer.setSingleShot(True)
+        self.pre_disconnect_timer.timeout.connect(self.start_disconnect_countdown)
+        
+        # Workflow and results screens are built on first use
+        self.workflow_widget = None
+        self.results_widget = None
         
         # Image URLs from data file
         self.image_urls = {
@@ -179,8 +561,22 @@ class WhichUSBGUI(QMainWindow):
         # Image cache
         self.loaded_images = {}
         
-        self.setup_ui()
+        # Shared network manager so image downloads reuse pooled connections
+        self.nam = QNetworkAccessManager(self)
+        image_cache = QNetworkDiskCache(self.nam)
+        image_cache.setCacheDirectory(IMAGE_CACHE_DIR)
+        self.nam.setCache(image_cache)
+        self.nam.setTransferTimeout(10000)  # Don't let a stalled download hold up loading
+        
+        # Kick off the network-bound downloads first so they overlap with building the UI.
+        # Replies are only delivered once the event loop runs, after setup_ui() has finished.
         self.load_images()
+        self.setup_ui()
+    
+    def closeEvent(self, event):
+        """Close without waiting on lsusb -v (the pool's destructor joins its threads)"""
+        self.cancel_detail_captures()
+        super().closeEvent(event)
     
     def resizeEvent(self, event):
         """Handle window resize events to rescale images"""
@@ -189,26 +585,40 @@ class WhichUSBGUI(QMainWindow):
     
     def load_images(self):
         """Load all images from URLs"""
-        self.image_loaders = []  # Keep references to prevent garbage collection
+        self.images_pending = len(self.image_urls)
         for name, url in self.image_urls.items():
-            loader = ImageLoader(url)
-            loader.image_loaded.connect(self.on_image_loaded)
-            self.image_loaders.append(loader)
-            loader.start()
-    
-    def on_image_loaded(self, url, pixmap):
-        """Handle loaded image"""
-        # Find which image this is
-        for name, image_url in self.image_urls.items():
-            if image_url == url:
-                self.loaded_images[name] = pixmap
-                # Update header image on loading screen if available
-                if name == 'header' and hasattr(self, 'header_image_label'):
-                    self.scale_and_set_image(self.header_image_label, pixmap, 600)  # 600px width
-                # If this is the found image and we're on the results screen, update it
-                elif name == 'found' and hasattr(self, 'found_image_label') and self.stacked_widget.currentIndex() == 3:
-                    self.scale_and_set_image(self.found_image_label, pixmap, 200)  # 200px width
-                break
+            request = QNetworkRequest(QUrl(url))
+            # Image URLs are versioned, so a cached copy never needs revalidating
+            request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute,
+                                 QNetworkRequest.CacheLoadControl.PreferCache)
+            reply = self.nam.get(request)
+            reply.finished.connect(lambda name=name, reply=reply: self.on_image_reply(name, reply))
+    
+    def on_image_reply(self, name, reply):
+        """Hand a finished image download off for decoding"""
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            decoder = ImageDecodeRunnable(name, reply.readAll(), IMAGE_SIZES[name])
+            decoder.signals.image_decoded.connect(self.on_image_loaded)
+            QThreadPool.globalInstance().start(decoder)
+        else:
+            print(f"Failed to load image from {reply.url().toString()}: {reply.errorString()}")
+            self.image_done()
+        reply.deleteLater()
+    
+    def on_image_loaded(self, name, image):
+        """Handle decoded image"""
+        if image.isNull():
+            print(f"Failed to decode image '{name}'")
+        else:
+            pixmap = QPixmap.fromImage(image)
+            self.loaded_images[name] = pixmap
+            # Update header image on loading screen if available
+            if name == 'header' and hasattr(self, 'header_image_label'):
+                self.header_image_label.setPixmap(pixmap)
+            # If this is the found image and we're on the results screen, update it
+            elif name == 'found' and hasattr(self, 'found_image_label') and self.stacked_widget.currentWidget() is self.results_widget:
+                self.found_image_label.setPixmap(pixmap)
+        self.image_done()
     
     def show_floating_image(self, image_name, side='left'):
         """Show a floating image on the specified side"""
@@ -216,11 +626,11 @@ class WhichUSBGUI(QMainWindow):
             pixmap = self.loaded_images[image_name]
             
             if side == 'left':
-                self.scale_and_set_image(self.left_image_label, pixmap, 400)  # 400px width
+                self.left_image_label.setPixmap(pixmap)
                 self.left_image_label.show()
                 self.right_image_label.hide()
             else:
-                self.scale_and_set_image(self.right_image_label, pixmap, 400)  # 400px width
+                self.right_image_label.setPixmap(pixmap)
                 self.right_image_label.show()
                 self.left_image_label.hide()
     
@@ -228,16 +638,9 @@ class WhichUSBGUI(QMainWindow):
         """Show the loading image in the center"""
         if 'loading' in self.loaded_images:
             pixmap = self.loaded_images['loading']
-            self.scale_and_set_image(self.loading_image_label, pixmap, 300)  # 300px width
+            self.loading_image_label.setPixmap(pixmap)
             self.loading_image_label.show()
     
-    def scale_and_set_image(self, label, pixmap, max_width, max_height=None):
-        """Scale image to fixed pixel size and set it to the label"""
-        if max_height is None:
-            max_height = max_width  # Square if height not specified
-        scaled_pixmap = pixmap.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        label.setPixmap(scaled_pixmap)
-    
     def hide_all_workflow_images(self):
         """Hide all workflow images"""
         self.left_image_label.hide()
@@ -256,8 +659,6 @@ class WhichUSBGUI(QMainWindow):
         # Create screens
         self.create_loading_screen()
         self.create_welcome_screen()
-        self.create_workflow_screen()
-        self.create_results_screen()
         
         # Add footer
         self.create_footer(central_widget_layout)
@@ -276,13 +677,13 @@ class WhichUSBGUI(QMainWindow):
         self.header_image_label = QLabel()
         self.header_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         if 'header' in self.loaded_images:
-            self.scale_and_set_image(self.header_image_label, self.loaded_images['header'], 600)
+            self.header_image_label.setPixmap(self.loaded_images['header'])
         layout.addWidget(self.header_image_label)
         
         # Loading message
         self.loading_message = QLabel("Loading...")
         self.loading_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_message.setFont(QFont("Arial", 16))
+        self.loading_message.setFont(FONT_BODY_LARGE)
         self.loading_message.setStyleSheet("color: #666666; margin-bottom: 20px;")
         layout.addWidget(self.loading_message)
         
@@ -290,35 +691,24 @@ class WhichUSBGUI(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #1976D2;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                color: white;
-                background-color: #f0f0f0;
-                height: 30px;
-            }
-            QProgressBar::chunk {
-                background-color: #1976D2;
-                border-radius: 6px;
-            }
-        """)
+        self.progress_bar.setObjectName("loadingProgress")
         layout.addWidget(self.progress_bar)
         
         layout.addStretch()
         self.stacked_widget.addWidget(loading_widget)
     
     def start_loading_sequence(self):
-        """Start the 3-second loading sequence"""
+        """Show the loading screen until all images have finished loading"""
         self.stacked_widget.setCurrentIndex(0)  # Show loading screen
-        
-        # Start loading thread
-        self.loading_thread = LoadingThread(3000)  # 3 seconds
-        self.loading_thread.progress_update.connect(self.update_progress)
-        self.loading_thread.loading_finished.connect(self.loading_complete)
-        self.loading_thread.start()
+        self.update_progress(0)
+    
+    def image_done(self):
+        """Advance loading progress as each image finishes, successfully or not"""
+        self.images_pending -= 1
+        total = len(self.image_urls)
+        self.update_progress(int(100 * (total - self.images_pending) / total))
+        if self.images_pending == 0:
+            self.loading_complete()
     
     def update_progress(self, value):
         """Update the progress bar"""
@@ -342,7 +732,7 @@ class WhichUSBGUI(QMainWindow):
         # Greeting
         greeting = QLabel("Hi there! I'm here to help you identify your USB device!")
         greeting.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        greeting.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        greeting.setFont(FONT_H2)
         greeting.setStyleSheet("color: #2E7D32; margin-bottom: 20px;")
         greeting.setWordWrap(True)
         layout.addWidget(greeting)
@@ -350,7 +740,7 @@ class WhichUSBGUI(QMainWindow):
         # Question
         question = QLabel("Is the device you're trying to identify already connected to your computer by USB?")
         question.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        question.setFont(QFont("Arial", 14))
+        question.setFont(FONT_BODY)
         question.setStyleSheet("color: #424242; margin-bottom: 30px;")
         question.setWordWrap(True)
         layout.addWidget(question)
@@ -361,37 +751,13 @@ class WhichUSBGUI(QMainWindow):
         
         self.yes_btn = QPushButton("Yes, it's connected")
         self.yes_btn.clicked.connect(self.device_connected_workflow)
-        self.yes_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.yes_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 15px 30px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.yes_btn.setFont(FONT_BUTTON)
+        self.yes_btn.setObjectName("yesBtn")
         
         self.no_btn = QPushButton("No, It's Not Connected")
         self.no_btn.clicked.connect(self.device_not_connected_workflow)
-        self.no_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.no_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 15px 30px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.no_btn.setFont(FONT_BUTTON)
+        self.no_btn.setObjectName("noBtn")
         
         button_layout.addWidget(self.yes_btn)
         button_layout.addWidget(self.no_btn)
@@ -400,6 +766,16 @@ class WhichUSBGUI(QMainWindow):
         layout.addStretch()
         self.stacked_widget.addWidget(welcome_widget)
     
+    def ensure_workflow_screen(self):
+        """Build the workflow screen the first time it is needed"""
+        if self.workflow_widget is None:
+            self.create_workflow_screen()
+    
+    def ensure_results_screen(self):
+        """Build the results screen the first time it is needed"""
+        if self.results_widget is None:
+            self.create_results_screen()
+    
     def create_workflow_screen(self):
         """Create the workflow execution screen"""
         workflow_widget = QWidget()
@@ -426,7 +802,7 @@ class WhichUSBGUI(QMainWindow):
         # Status message
         self.workflow_status = QLabel()
         self.workflow_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.workflow_status.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.workflow_status.setFont(FONT_H3)
         self.workflow_status.setStyleSheet("color: #1976D2; margin-bottom: 20px;")
         self.workflow_status.setWordWrap(True)
         center_layout.addWidget(self.workflow_status)
@@ -440,7 +816,7 @@ class WhichUSBGUI(QMainWindow):
         # Countdown display
         self.countdown_label = QLabel()
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.countdown_label.setFont(QFont("Arial", 48, QFont.Weight.Bold))
+        self.countdown_label.setFont(FONT_COUNTDOWN)
         self.countdown_label.setStyleSheet("color: #FF5722; margin: 20px;")
         center_layout.addWidget(self.countdown_label)
         
@@ -456,27 +832,19 @@ class WhichUSBGUI(QMainWindow):
         
         # Success message (initially hidden)
         self.success_frame = QFrame()
-        self.success_frame.setStyleSheet("""
-            QFrame {
-                background-color: #E8F5E8;
-                border: 2px solid #4CAF50;
-                border-radius: 12px;
-                padding: 20px;
-                margin: 20px;
-            }
-        """)
+        self.success_frame.setObjectName("successFrame")
         self.success_frame.hide()
         
         success_layout = QVBoxLayout(self.success_frame)
         
         success_icon = QLabel("✅")
         success_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        success_icon.setFont(QFont("Arial", 36))
+        success_icon.setFont(FONT_ICON)
         success_layout.addWidget(success_icon)
         
         self.success_message = QLabel()
         self.success_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.success_message.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.success_message.setFont(FONT_H3)
         self.success_message.setStyleSheet("color: #2E7D32;")
         success_layout.addWidget(self.success_message)
         
@@ -485,42 +853,20 @@ class WhichUSBGUI(QMainWindow):
         # View Results button (initially hidden)
         self.view_results_btn = QPushButton("View Results")
         self.view_results_btn.clicked.connect(self.show_results)
-        self.view_results_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        self.view_results_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 15px 40px;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        self.view_results_btn.setFont(FONT_H3)
+        self.view_results_btn.setObjectName("viewResultsBtn")
         self.view_results_btn.hide()
         layout.addWidget(self.view_results_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # Back button
         self.back_btn = QPushButton("← Back")
         self.back_btn.clicked.connect(self.show_welcome)
-        self.back_btn.setFont(QFont("Arial", 12))
-        self.back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #757575;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #616161;
-            }
-        """)
+        self.back_btn.setFont(FONT_SMALL)
+        self.back_btn.setObjectName("backBtn")
         layout.addWidget(self.back_btn, alignment=Qt.AlignmentFlag.AlignLeft)
         
         layout.addStretch()
+        self.workflow_widget = workflow_widget
         self.stacked_widget.addWidget(workflow_widget)
     
     def create_results_screen(self):
@@ -539,13 +885,13 @@ class WhichUSBGUI(QMainWindow):
         self.found_image_label = QLabel()
         self.found_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         if 'found' in self.loaded_images:
-            self.scale_and_set_image(self.found_image_label, self.loaded_images['found'], 200)
+            self.found_image_label.setPixmap(self.loaded_images['found'])
         header_layout.addWidget(self.found_image_label)
         
         # Header text
         header = QLabel("Your Identified Device")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        header.setFont(FONT_H1)
         header.setStyleSheet("color: #1976D2; margin-bottom: 30px;")
         header_layout.addWidget(header)
         
@@ -566,37 +912,31 @@ class WhichUSBGUI(QMainWindow):
         scroll_area.setWidget(self.device_cards_container)
         layout.addWidget(scroll_area)
         
+        # Cards are built once here and only have their text updated per result
+        self.create_device_cards()
+        
         # Back to start button
         self.restart_btn = QPushButton("Identify Another Device")
         self.restart_btn.clicked.connect(self.restart_app)
-        self.restart_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.restart_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 30px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.restart_btn.setFont(FONT_BUTTON)
+        self.restart_btn.setObjectName("restartBtn")
         layout.addWidget(self.restart_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
+        self.results_widget = results_widget
         self.stacked_widget.addWidget(results_widget)
     
     def create_footer(self, parent_layout):
         """Create footer with attribution"""
         footer = QLabel("Utility: Daniel Rosehill (danielrosehill.com)")
         footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        footer.setFont(QFont("Arial", 10))
+        footer.setFont(FONT_FOOTER)
         footer.setStyleSheet("color: #757575; padding: 10px; border-top: 1px solid #E0E0E0;")
         parent_layout.addWidget(footer)
     
     def device_connected_workflow(self):
         """Handle workflow when device is already connected"""
-        self.stacked_widget.setCurrentIndex(2)  # Switch to workflow screen
+        self.ensure_workflow_screen()
+        self.stacked_widget.setCurrentWidget(self.workflow_widget)  # Switch to workflow screen
         self.workflow_status.setText("Great! Keep it there while I grab lsusb")
         self.countdown_label.hide()
         self.success_frame.hide()
@@ -607,13 +947,47 @@ class WhichUSBGUI(QMainWindow):
         self.show_loading_image()
         
         # Capture initial state
-        self.capture_thread = USBCaptureThread()
-        self.capture_thread.finished.connect(self.first_capture_connected_complete)
-        self.capture_thread.start()
+        self.start_capture(self.first_capture_connected_complete)
+        # The device is still attached but not yet known, so grab every device's
+        # sysfs/udev and lsusb -v details now
+        self.start_detail_capture()
+    
+    def start_capture(self, on_finished):
+        """Capture USB devices in the background and pass them to on_finished"""
+        capture = CaptureRunnable()
+        capture.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(capture)
+    
+    def start_detail_capture(self, device=None):
+        """Capture device details in the background, alongside the rest of the workflow"""
+        self.details_pending = True
+        capture = DetailCaptureRunnable(self.workflow_generation, device)
+        capture.signals.captured.connect(self.store_device_details)
+        self.detail_captures = [c for c in self.detail_captures if not c.done]
+        self.detail_captures.append(capture)
+        self.detail_pool.start(capture)
+    
+    def cancel_detail_captures(self):
+        """Drop queued detail captures and kill running lsusb -v runs"""
+        for capture in self.detail_captures:
+            capture.cancel()
+        self.detail_pool.clear()
+        self.detail_captures = []
+    
+    def store_device_details(self, generation, sections, reports):
+        """Keep lsusb -v sections and sysfs/udev reports for the detailed inspection"""
+        if generation != self.workflow_generation:
+            return  # Started by a workflow that has since been reset
+        self.lsusb_cache.update(sections)
+        self.sysfs_cache.update(reports)
+        self.details_pending = False
+        if self.inspection_deferred:
+            self.inspection_deferred = False
+            self.start_detailed_inspection_for_identified_device()
     
     def first_capture_connected_complete(self, devices):
         """Handle completion of first capture in connected workflow"""
-        self.first_capture = devices
+        self.first_capture = index_devices(devices)
         self.workflow_status.setText("Analyzing connected device before disconnection...")
         self.countdown_label.hide()
         
@@ -624,7 +998,8 @@ class WhichUSBGUI(QMainWindow):
     
     def device_not_connected_workflow(self):
         """Handle workflow when device is not connected"""
-        self.stacked_widget.setCurrentIndex(2)  # Switch to workflow screen
+        self.ensure_workflow_screen()
+        self.stacked_widget.setCurrentWidget(self.workflow_widget)  # Switch to workflow screen
         self.workflow_status.setText("Great. When the countdown reaches zero please connect the device you are trying to identify")
         self.countdown_label.show()
         self.success_frame.hide()
@@ -635,22 +1010,36 @@ class WhichUSBGUI(QMainWindow):
         self.show_floating_image('attach', 'left')
         
         # Capture initial state (without device)
-        self.capture_thread = USBCaptureThread()
-        self.capture_thread.finished.connect(self.first_capture_not_connected_complete)
-        self.capture_thread.start()
+        self.start_capture(self.first_capture_not_connected_complete)
     
     def first_capture_not_connected_complete(self, devices):
         """Handle completion of first capture in not connected workflow"""
-        self.first_capture = devices
+        self.first_capture = index_devices(devices)
         
         # Start countdown
-        self.countdown_thread = CountdownThread(3)
-        self.countdown_thread.countdown_update.connect(self.update_countdown)
-        self.countdown_thread.countdown_finished.connect(self.countdown_finished_not_connected)
-        self.countdown_thread.start()
+        self.start_countdown(3, self.countdown_finished_not_connected)
+    
+    def start_countdown(self, seconds, on_finished):
+        """Count down once per second on the GUI thread, then call on_finished"""
+        self.countdown_remaining = seconds
+        self.countdown_on_finished = on_finished
+        self.update_countdown(seconds)
+        self.countdown_timer.start(1000)  # (Re)starts the timer if it was already running
+    
+    def countdown_tick(self):
+        """Advance the countdown by one second"""
+        self.countdown_remaining -= 1
+        if self.countdown_remaining > 0:
+            self.update_countdown(self.countdown_remaining)
+        else:
+            self.countdown_timer.stop()
+            self.countdown_on_finished()
     
     def update_countdown(self, seconds):
         """Update countdown display"""
+        if seconds == self.last_countdown_shown:
+            return  # Label already shows this value; skip the repaint
+        self.last_countdown_shown = seconds
         self.countdown_label.setText(str(seconds))
     
     def countdown_finished_connected(self):
@@ -689,39 +1078,20 @@ class WhichUSBGUI(QMainWindow):
         self.monitor_thread.device_change_detected.connect(self.on_connect_detected)
         self.monitor_thread.start()
     
-    def on_disconnect_detected(self, current_devices):
+    def on_disconnect_detected(self, current_capture, removed_devices):
         """Handle device disconnection detection"""
-        self.second_capture = current_devices
+        self.second_capture = current_capture
         self.workflow_status.setText("Device disconnected! Analyzing...")
-        self.analyze_disconnect_difference()
+        self.analyze_disconnect_difference(removed_devices)
     
-    def on_connect_detected(self, current_devices):
+    def on_connect_detected(self, current_capture, added_devices):
         """Handle device connection detection"""
-        self.second_capture = current_devices
+        self.second_capture = current_capture
+        # New devices aren't in any earlier detail capture; describe just the
+        # one that will be inspected
+        self.start_detail_capture(added_devices[0])
         self.workflow_status.setText("Device connected! Analyzing...")
-        self.analyze_connect_difference()
-    
-    def capture_after_disconnect(self):
-        """Capture USB state after device disconnection"""
-        self.capture_thread = USBCaptureThread()
-        self.capture_thread.finished.connect(self.second_capture_disconnect_complete)
-        self.capture_thread.start()
-    
-    def capture_after_connect(self):
-        """Capture USB state after device connection"""
-        self.capture_thread = USBCaptureThread()
-        self.capture_thread.finished.connect(self.second_capture_connect_complete)
-        self.capture_thread.start()
-    
-    def second_capture_disconnect_complete(self, devices):
-        """Handle completion of second capture in disconnect workflow"""
-        self.second_capture = devices
-        self.analyze_disconnect_difference()
-    
-    def second_capture_connect_complete(self, devices):
-        """Handle completion of second capture in connect workflow"""
-        self.second_capture = devices
-        self.analyze_connect_difference()
+        self.analyze_connect_difference(added_devices)
     
     def start_pre_disconnect_analysis(self):
         """Start detailed analysis before disconnection"""
@@ -729,7 +1099,7 @@ class WhichUSBGUI(QMainWindow):
         
         # We'll analyze the device after we identify it in the disconnect workflow
         # For now, proceed to countdown for disconnection
-        QTimer.singleShot(2000, self.start_disconnect_countdown)
+        self.pre_disconnect_timer.start(2000)
     
     def start_disconnect_countdown(self):
         """Start countdown for device disconnection"""
@@ -741,16 +1111,11 @@ class WhichUSBGUI(QMainWindow):
         self.show_floating_image('disconnect', 'left')
         
         # Start countdown
-        self.countdown_thread = CountdownThread(3)
-        self.countdown_thread.countdown_update.connect(self.update_countdown)
-        self.countdown_thread.countdown_finished.connect(self.countdown_finished_connected)
-        self.countdown_thread.start()
+        self.start_countdown(3, self.countdown_finished_connected)
     
-    def analyze_disconnect_difference(self):
+    def analyze_disconnect_difference(self, removed_devices):
         """Analyze difference when device was disconnected"""
-        # Find device that was removed
-        removed_devices = self.get_devices_difference(self.second_capture, self.first_capture)
-        
+        # The monitor reports the removed devices, so there is nothing to diff here
         if removed_devices:
             self.identified_device = removed_devices[0]  # Take first identified device
             # Start detailed inspection of the identified device using first_capture data
@@ -758,11 +1123,9 @@ class WhichUSBGUI(QMainWindow):
         else:
             self.show_success("No device changes detected")
     
-    def analyze_connect_difference(self):
+    def analyze_connect_difference(self, added_devices):
         """Analyze difference when device was connected"""
-        # Find device that was added
-        added_devices = self.get_devices_difference(self.first_capture, self.second_capture)
-        
+        # The monitor reports the added devices, so there is nothing to diff here
         if added_devices:
             self.identified_device = added_devices[0]  # Take first identified device
             # Start detailed inspection of the newly connected device
@@ -774,9 +1137,15 @@ class WhichUSBGUI(QMainWindow):
         """Start detailed inspection for the identified device"""
         if self.identified_device:
             self.workflow_status.setText("Performing detailed hardware inspection...")
-            self.inspection_thread = DetailedInspectionThread(self.identified_device)
-            self.inspection_thread.inspection_complete.connect(self.detailed_inspection_complete)
-            self.inspection_thread.start()
+            if self.details_pending:
+                # Picked up again by store_device_details
+                self.inspection_deferred = True
+                return
+            key = device_key(self.identified_device)
+            inspection = InspectionRunnable(self.identified_device, self.lsusb_cache.get(key),
+                                            self.sysfs_cache.get(key))
+            inspection.signals.inspection_complete.connect(self.detailed_inspection_complete)
+            QThreadPool.globalInstance().start(inspection)
         else:
             self.show_success("Device identified but detailed inspection failed")
     
@@ -785,11 +1154,6 @@ class WhichUSBGUI(QMainWindow):
         self.detailed_inspection_data = inspection_data
         self.show_success(f"Device captured: 1 device identified with detailed analysis")
     
-    def get_devices_difference(self, before: List[USBDevice], after: List[USBDevice]) -> List[USBDevice]:
-        """Find devices that are in 'after' but not in 'before'."""
-        before_set = {(d.vendor_id, d.product_id, d.description) for d in before}
-        return [d for d in after if (d.vendor_id, d.product_id, d.description) not in before_set]
-    
     def show_success(self, message):
         """Show success message with checkmark"""
         self.workflow_status.hide()
@@ -799,7 +1163,8 @@ class WhichUSBGUI(QMainWindow):
     
     def show_results(self):
         """Switch to results screen and display device information"""
-        self.stacked_widget.setCurrentIndex(3)  # Switch to results screen
+        self.ensure_results_screen()
+        self.stacked_widget.setCurrentWidget(self.results_widget)  # Switch to results screen
         self.display_device_results()
     
     def show_welcome(self):
@@ -813,14 +1178,24 @@ class WhichUSBGUI(QMainWindow):
     
     def reset_workflow_state(self):
         """Reset all workflow state"""
+        # Cancel any countdown still in progress, or about to start
+        self.countdown_timer.stop()
+        self.pre_disconnect_timer.stop()
+        
         # Stop any running monitor thread
         if self.monitor_thread:
             self.monitor_thread.stop()
             self.monitor_thread.wait()
             self.monitor_thread = None
             
-        self.first_capture = []
-        self.second_capture = []
+        self.first_capture = {}
+        self.second_capture = {}
+        self.cancel_detail_captures()  # Their results would be ignored anyway
+        self.lsusb_cache.clear()
+        self.sysfs_cache.clear()
+        self.workflow_generation += 1
+        self.details_pending = False
+        self.inspection_deferred = False
         self.identified_device = None
         self.detailed_inspection_data = None
         self.workflow_status.show()
@@ -828,142 +1203,142 @@ class WhichUSBGUI(QMainWindow):
         self.success_frame.hide()
         self.view_results_btn.hide()
         
-        # Clear device cards
-        while self.device_cards_layout.count():
-            child = self.device_cards_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Hide the (reused) device cards
+        if self.results_widget is not None:
+            self.device_cards_container.hide()
+    
+    def create_device_cards(self):
+        """Build the result cards and detailed inspection widgets once"""
+        self.no_device_label = QLabel("No device was identified")
+        self.no_device_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_device_label.setFont(FONT_BODY_LARGE)
+        self.no_device_label.setStyleSheet("color: #757575; padding: 40px;")
+        self.no_device_label.hide()
+        self.device_cards_layout.addWidget(self.no_device_label)
+        
+        self.card_widgets = {}
+        for field, title, color in DEVICE_CARDS:
+            card, value_label, copy_btn = self.create_info_card(field, title, color)
+            card.hide()
+            self.device_cards_layout.addWidget(card)
+            self.card_widgets[field] = (card, value_label, copy_btn)
+        
+        self.create_detailed_inspection_section()
+    
+    def device_field_values(self, device):
+        """Text shown and copied for each result card"""
+        return {
+            'name': device.description,
+            'bus': f"Bus {device.bus}",
+            'vendor': device.vendor_id,
+            'product': device.product_id,
+            'plain': f"Bus {device.bus} Device {device.device}: ID {device.vendor_id}:{device.product_id} {device.description}",
+        }
     
     def display_device_results(self):
         """Display the identified device in big cards with copy buttons"""
-        # Clear existing cards
-        while self.device_cards_layout.count():
-            child = self.device_cards_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Batch all card changes into a single relayout and repaint
+        container = self.device_cards_container
+        container.setUpdatesEnabled(False)
+        self.device_cards_layout.setEnabled(False)
+        try:
+            self.update_device_cards()
+        finally:
+            self.device_cards_layout.setEnabled(True)
+            container.setUpdatesEnabled(True)
+            container.update()
+    
+    def update_device_cards(self):
+        """Fill the cached cards with the identified device's details"""
+        self.device_cards_container.show()
         
         if not self.identified_device:
-            no_device_label = QLabel("No device was identified")
-            no_device_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_device_label.setFont(QFont("Arial", 16))
-            no_device_label.setStyleSheet("color: #757575; padding: 40px;")
-            self.device_cards_layout.addWidget(no_device_label)
+            for card, _, _ in self.card_widgets.values():
+                card.hide()
+            self.set_detailed_inspection_visible(False)
+            self.no_device_label.show()
             return
         
-        device = self.identified_device
-        
-        # Device Name Card
-        name_card = self.create_info_card("Name", device.description, "#4CAF50")
-        self.device_cards_layout.addWidget(name_card)
-        
-        # USB Bus Card
-        bus_card = self.create_info_card("USB Bus", f"Bus {device.bus}", "#2196F3")
-        self.device_cards_layout.addWidget(bus_card)
-        
-        # Vendor ID Card
-        vendor_card = self.create_info_card("Vendor ID", device.vendor_id, "#FF9800")
-        self.device_cards_layout.addWidget(vendor_card)
+        self.no_device_label.hide()
+        values = self.device_field_values(self.identified_device)
+        for field, (card, value_label, _) in self.card_widgets.items():
+            value_label.setText(values[field])
+            card.show()
         
-        # Product ID Card
-        product_card = self.create_info_card("Product ID", device.product_id, "#9C27B0")
-        self.device_cards_layout.addWidget(product_card)
-        
-        # Plain text line
-        plain_text = f"Bus {device.bus} Device {device.device}: ID {device.vendor_id}:{device.product_id} {device.description}"
-        plain_card = self.create_info_card("Plain Text Line", plain_text, "#795548")
-        self.device_cards_layout.addWidget(plain_card)
-        
-        # Add detailed inspection section if available
+        # Show detailed inspection section if available
         if self.detailed_inspection_data:
-            self.add_detailed_inspection_section()
+            self.inspection_text.setPlainText(self.detailed_inspection_data)
+        self.set_detailed_inspection_visible(bool(self.detailed_inspection_data))
     
-    def create_info_card(self, title, value, color):
+    def create_info_card(self, field, title, color):
         """Create a big card for device information with copy button"""
+        frame_qss, title_qss, button_qss = CARD_STYLESHEETS[color]
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 3px solid {color};
-                border-radius: 12px;
-                padding: 20px;
-                margin: 10px;
-            }}
-        """)
+        card.setStyleSheet(frame_qss)
         
         layout = QVBoxLayout(card)
         
         # Title
         title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {color}; margin-bottom: 10px;")
+        title_label.setFont(FONT_H3)
+        title_label.setStyleSheet(title_qss)
         layout.addWidget(title_label)
         
         # Value
-        value_label = QLabel(value)
-        value_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        value_label = QLabel()
+        value_label.setFont(FONT_VALUE)
         value_label.setStyleSheet("color: #212121; margin-bottom: 15px;")
         value_label.setWordWrap(True)
         layout.addWidget(value_label)
         
-        # Copy button
+        # Copy button; the value is looked up at click time since cards are reused
         copy_btn = QPushButton("📋 Copy to Clipboard")
-        copy_btn.clicked.connect(lambda: self.copy_to_clipboard(value))
-        copy_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        copy_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.darken_color(color)};
-            }}
-        """)
+        copy_btn.clicked.connect(partial(self.copy_device_field, field))
+        copy_btn.setFont(FONT_BUTTON_SMALL)
+        copy_btn.setStyleSheet(button_qss)
         layout.addWidget(copy_btn)
         
-        return card
+        return card, value_label, copy_btn
+    
+    def copy_device_field(self, field):
+        """Copy one field of the identified device to the clipboard"""
+        if self.identified_device:
+            self.copy_to_clipboard(self.device_field_values(self.identified_device)[field])
+    
+    def copy_detailed_inspection(self):
+        """Copy the current detailed inspection report to the clipboard"""
+        if self.detailed_inspection_data:
+            self.copy_to_clipboard(self.detailed_inspection_data)
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self.clipboard.setText(text)
         
         # Show temporary feedback
         sender = self.sender()
         original_text = sender.text()
         sender.setText("✅ Copied!")
-        QTimer.singleShot(1500, lambda: sender.setText(original_text))
-    
-    def darken_color(self, color):
-        """Darken a hex color for hover effects"""
-        color_map = {
-            "#4CAF50": "#45a049",
-            "#2196F3": "#1976D2", 
-            "#FF9800": "#F57C00",
-            "#9C27B0": "#7B1FA2",
-            "#795548": "#5D4037"
-        }
-        return color_map.get(color, color)
+        QTimer.singleShot(1500, partial(sender.setText, original_text))
     
-    def add_detailed_inspection_section(self):
-        """Add detailed inspection results directly to the results screen"""
+    def create_detailed_inspection_section(self):
+        """Create the detailed inspection widgets on the results screen"""
         # Section header
-        inspection_header = QLabel("🔍 Detailed Hardware Inspection")
-        inspection_header.setFont(QFont("Arial", 18, QFont.Weight.Bold))
-        inspection_header.setStyleSheet("color: #607D8B; margin: 30px 0 20px 0; padding: 10px;")
-        inspection_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.device_cards_layout.addWidget(inspection_header)
+        self.inspection_header = QLabel("🔍 Detailed Hardware Inspection")
+        self.inspection_header.setFont(FONT_H2)
+        self.inspection_header.setStyleSheet("color: #607D8B; margin: 30px 0 20px 0; padding: 10px;")
+        self.inspection_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.device_cards_layout.addWidget(self.inspection_header)
         
         # Detailed inspection text area
-        inspection_text = QTextEdit()
-        inspection_text.setFont(QFont("Courier", 9))
-        inspection_text.setReadOnly(True)
-        inspection_text.setText(self.detailed_inspection_data)
-        inspection_text.setMinimumHeight(400)
-        inspection_text.setMaximumHeight(500)
-        inspection_text.setStyleSheet("""
+        self.inspection_text = QTextEdit()
+        self.inspection_text.setFont(FONT_MONO)
+        self.inspection_text.setReadOnly(True)
+        # lsusb/sysfs dump is plain text: skip rich-text sniffing and undo history
+        self.inspection_text.setAcceptRichText(False)
+        self.inspection_text.setUndoRedoEnabled(False)
+        self.inspection_text.setMinimumHeight(400)
+        self.inspection_text.setMaximumHeight(500)
+        self.inspection_text.setStyleSheet("""
             QTextEdit {
                 background-color: #F5F5F5;
                 border: 2px solid #607D8B;
@@ -972,13 +1347,13 @@ class WhichUSBGUI(QMainWindow):
                 margin: 10px;
             }
         """)
-        self.device_cards_layout.addWidget(inspection_text)
+        self.device_cards_layout.addWidget(self.inspection_text)
         
         # Copy detailed inspection button
-        copy_inspection_btn = QPushButton("📋 Copy Detailed Inspection")
-        copy_inspection_btn.clicked.connect(lambda: self.copy_to_clipboard(self.detailed_inspection_data))
-        copy_inspection_btn.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        copy_inspection_btn.setStyleSheet("""
+        self.copy_inspection_btn = QPushButton("📋 Copy Detailed Inspection")
+        self.copy_inspection_btn.clicked.connect(self.copy_detailed_inspection)
+        self.copy_inspection_btn.setFont(FONT_BUTTON_SMALL)
+        self.copy_inspection_btn.setStyleSheet("""
             QPushButton {
                 background-color: #607D8B;
                 color: white;
@@ -991,84 +1366,72 @@ class WhichUSBGUI(QMainWindow):
                 background-color: #455A64;
             }
         """)
-        self.device_cards_layout.addWidget(copy_inspection_btn)
+        self.device_cards_layout.addWidget(self.copy_inspection_btn)
+        
+        self.set_detailed_inspection_visible(False)
+    
+    def set_detailed_inspection_visible(self, visible):
+        """Show or hide the detailed inspection widgets"""
+        self.inspection_header.setVisible(visible)
+        self.inspection_text.setVisible(visible)
+        self.copy_inspection_btn.setVisible(visible)
 
-class DetailedInspectionThread(QThread):
+class InspectionSignals(QObject):
     inspection_complete = pyqtSignal(str)
+
+class InspectionRunnable(QRunnable):
+    """Build the detailed inspection report on a pool thread"""
     
-    def __init__(self, device):
+    def __init__(self, device, lsusb_section=None, sysfs_report=None):
         super().__init__()
         self.device = device
+        # Both captured while the device was attached
+        self.lsusb_section = lsusb_section
+        self.sysfs_report = sysfs_report
+        self.signals = InspectionSignals()
     
     def run(self):
         """Perform detailed hardware inspection"""
         result = self.get_detailed_device_info()
-        self.inspection_complete.emit(result)
+        self.signals.inspection_complete.emit(result)
     
     def get_detailed_device_info(self):
-        """Get detailed device information using lsusb -v and udevadm"""
-        info_sections = []
+        """Format detailed device information from the lsusb -v and sysfs/udev captures"""
+        buf = io.StringIO()
+        w = buf.write
         
         # Basic device info
-        info_sections.append("=== BASIC DEVICE INFORMATION ===")
-        info_sections.append(f"Device Name: {self.device.description}")
-        info_sections.append(f"USB Bus: {self.device.bus}")
-        info_sections.append(f"Device Number: {self.device.device}")
-        info_sections.append(f"Vendor ID: {self.device.vendor_id}")
-        info_sections.append(f"Product ID: {self.device.product_id}")
-        info_sections.append("")
+        w("=== BASIC DEVICE INFORMATION ===\n")
+        w(f"Device Name: {self.device.description}\n")
+        w(f"USB Bus: {self.device.bus}\n")
+        w(f"Device Number: {self.device.device}\n")
+        w(f"Vendor ID: {self.device.vendor_id}\n")
+        w(f"Product ID: {self.device.product_id}\n")
+        w("\n")
         
         # Detailed lsusb output
-        info_sections.append("=== DETAILED USB INFORMATION (lsusb -v) ===")
-        try:
-            # Run lsusb -v for this specific device
-            result = subprocess.run([
-                'lsusb', '-v', '-d', f"{self.device.vendor_id}:{self.device.product_id}"
-            ], capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0 and result.stdout:
-                info_sections.append(result.stdout)
-            else:
-                info_sections.append("Could not retrieve detailed USB information")
-                if result.stderr:
-                    info_sections.append(f"Error: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            info_sections.append("Timeout while retrieving detailed USB information")
-        except Exception as e:
-            info_sections.append(f"Error running lsusb: {e}")
+        w("=== DETAILED USB INFORMATION (lsusb -v) ===\n")
+        if self.lsusb_section:
+            w(self.lsusb_section)
+            w("\n")
+        else:
+            w("Could not retrieve detailed USB information\n")
         
-        info_sections.append("")
+        w("\n")
         
-        # udevadm information
-        info_sections.append("=== SYSTEM DEVICE INFORMATION (udevadm) ===")
-        try:
-            # Find the device path using udevadm
-            result = subprocess.run([
-                'find', '/sys/bus/usb/devices/', '-name', f"{self.device.bus}-*"
-            ], capture_output=True, text=True, timeout=5)
-            
-            if result.returncode == 0 and result.stdout:
-                device_paths = result.stdout.strip().split('\n')
-                for path in device_paths:
-                    if path:
-                        # Get udevadm info for this path
-                        udev_result = subprocess.run([
-                            'udevadm', 'info', '--path', path
-                        ], capture_output=True, text=True, timeout=5)
-                        
-                        if udev_result.returncode == 0:
-                            info_sections.append(f"Device path: {path}")
-                            info_sections.append(udev_result.stdout)
-                            break
-            else:
-                info_sections.append("Could not find device in sysfs")
-        except Exception as e:
-            info_sections.append(f"Error running udevadm: {e}")
+        # sysfs attributes and udev properties, the data udevadm info reports
+        w("=== SYSTEM DEVICE INFORMATION (sysfs/udev) ===\n")
+        report = self.sysfs_report
+        if report is None:
+            # Not captured in advance, so read it now
+            report = sysfs_device_report(self.device.bus, self.device.device)
+        w(report)
         
-        return "\n".join(info_sections)
+        return buf.getvalue()
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
     
     try:
         window = WhichUSBGUI()